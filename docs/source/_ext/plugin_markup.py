@@ -2,27 +2,34 @@
 # SPDX-License-Identifier: Apache-2.0
 # SPDX-FileContributor: David Pape
 
+import hashlib
 import json
 import re
 from pathlib import Path
-from typing import Any, Dict
+from typing import TYPE_CHECKING, Any, Dict
 
 from docutils import nodes
-from jsonschema import validate
 from sphinx.application import Sphinx
+from sphinx.environment import BuildEnvironment
 from sphinx.util import logging
 from sphinx.util.console import colorize
 from sphinx.util.docutils import SphinxDirective
 
-from hermes.commands.marketplace import (
-    SchemaOrgOrganization,
-    SchemaOrgSoftwareApplication,
-    schema_org_hermes,
-)
+# jsonschema and the marketplace models (and thus pydantic and requests) are only
+# imported once the directive actually runs, so they do not slow down loading the
+# extension for builds that do not use it.
+if TYPE_CHECKING:
+    from hermes.commands.marketplace import SchemaOrgSoftwareApplication
 
 
 logger = logging.getLogger(__name__)
 
+#: Parsed JSON files, keyed by content digest.
+_json_cache: Dict[str, Any] = {}
+
+#: Compiled validators for schema files, keyed by content digest.
+_validator_cache: Dict[str, Any] = {}
+
 
 def log_message(text: str, detail: str = None) -> None:
     message = colorize("bold", "[Plugin Markup]") + " " + text
@@ -31,6 +38,42 @@ def log_message(text: str, detail: str = None) -> None:
     logger.info(message)
 
 
+def compile_schema(schema: Dict[str, Any]) -> Any:
+    """Create a reusable validator for ``schema``.
+
+    The validator class is picked according to the ``$schema`` of the given schema. The
+    schema itself is checked once here instead of on every validation.
+    """
+    from jsonschema.validators import validator_for
+
+    validator_class = validator_for(schema)
+    validator_class.check_schema(schema)
+    return validator_class(schema)
+
+
+def content_digest(content: bytes) -> str:
+    """Hash file contents for use as a cache key.
+
+    Unlike modification times, content hashes stay valid across fresh checkouts, e.g.,
+    in CI.
+    """
+    return hashlib.blake2b(content, digest_size=16).hexdigest()
+
+
+def load_json(content: bytes, digest: str) -> Any:
+    """Parse the ``content`` of a JSON file, reusing the result for identical contents."""
+    if digest not in _json_cache:
+        _json_cache[digest] = json.loads(content)
+    return _json_cache[digest]
+
+
+def schema_validator(content: bytes, digest: str) -> Any:
+    """Get a validator for the jsonschema in ``content``, reusing it for identical contents."""
+    if digest not in _validator_cache:
+        _validator_cache[digest] = compile_schema(load_json(content, digest))
+    return _validator_cache[digest]
+
+
 def keywordify(text: str) -> str:
     """Make keyword-friendly text.
 
@@ -44,7 +87,7 @@ def keywordify(text: str) -> str:
     return re.sub(r"[^a-z]", "-", text)
 
 
-def plugin_to_schema_org(plugin: Dict[str, Any]) -> SchemaOrgSoftwareApplication:
+def plugin_to_schema_org(plugin: Dict[str, Any]) -> "SchemaOrgSoftwareApplication":
     """Convert plugin metadata from the used JSON format to Schema.org.
 
     The ``plugin`` is transformed into a ``schema:SoftwareApplication``. For most
@@ -56,24 +99,39 @@ def plugin_to_schema_org(plugin: Dict[str, Any]) -> SchemaOrgSoftwareApplication
     keywords by making the text "keyword-friendly" and prepending ``hermes-harvest-``.
     If the plugin is marked as a Hermes ``builtin``, this is expressed using
     ``schema:isPartOf``.
+
+    As the plugin data has already been validated against the plugins schema, the
+    models are constructed without running pydantic validation again.
     """
+    from hermes.commands.marketplace import (
+        SchemaOrgOrganization,
+        SchemaOrgSoftwareApplication,
+        schema_org_hermes,
+    )
+
     steps = plugin.get("steps", [])
     keywords = [f"hermes-step-{step}" for step in steps]
     if "harvest" in steps:
         harvested_files = plugin.get("harvested_files", [])
         keywords += [f"hermes-harvest-{keywordify(file)}" for file in harvested_files]
 
-    return SchemaOrgSoftwareApplication(
+    return SchemaOrgSoftwareApplication.model_construct(
         name=plugin.get("name"),
         url=plugin.get("repository_url"),
         install_url=plugin.get("pypi_url"),
         abstract=plugin.get("description"),
-        author=SchemaOrgOrganization(name=au) if (au := plugin.get("author")) else None,
+        author=SchemaOrgOrganization.model_construct(name=au) if (au := plugin.get("author")) else None,
         is_part_of=schema_org_hermes if plugin.get("builtin", False) else None,
         keywords=keywords or None,
     )
 
 
+def render_plugin(plugin: Dict[str, Any]) -> str:
+    """Render a single plugin from the plugins file to a JSON-LD ``<script>`` tag."""
+    markup = plugin_to_schema_org(plugin).model_dump_jsonld()
+    return f'<script type="application/ld+json">{markup}</script>'
+
+
 class PluginMarkupDirective(SphinxDirective):
     """A Sphinx directive to render the ``plugins.json`` file to Schema.org markup.
 
@@ -96,33 +154,93 @@ class PluginMarkupDirective(SphinxDirective):
         directory = filename.parent
 
         plugins_file = directory / self.arguments[0]
-        log_message("reading plugins file", detail=str(plugins_file))
-        with open(plugins_file) as file:
-            plugin_data = json.load(file)
-
         plugins_schema_file = directory / self.arguments[1]
-        log_message("reading plugins schema file", detail=str(plugins_schema_file))
-        with open(plugins_schema_file) as file:
-            plugin_schema = json.load(file)
+        self.env.note_dependency(str(plugins_file))
+        self.env.note_dependency(str(plugins_schema_file))
+
+        from hermes.utils import hermes_doi, hermes_version
+
+        # The rendered markup depends on the contents of both files and on the HERMES
+        # release the converter and the marketplace models come from (e.g., its DOI).
+        plugins_content = plugins_file.read_bytes()
+        plugins_digest = content_digest(plugins_content)
+        plugins_schema_content = plugins_schema_file.read_bytes()
+        plugins_schema_digest = content_digest(plugins_schema_content)
+        cache_key = f"{plugins_digest}-{plugins_schema_digest}-{hermes_version}-{hermes_doi}"
+
+        # Only markup used by the current version of the document is kept.
+        doc_cache = self.env.plugin_markup_cache.setdefault(self.env.docname, {})
+        previous_cache = self.env.plugin_markup_previous.get(self.env.docname, {})
+
+        if cache_key in doc_cache:
+            log_message("reusing markup", detail=str(plugins_file))
+        elif cache_key in previous_cache:
+            log_message("reusing markup from previous build", detail=str(plugins_file))
+            doc_cache[cache_key] = previous_cache[cache_key]
+        else:
+            log_message("reading plugins file", detail=str(plugins_file))
+            plugin_data = load_json(plugins_content, plugins_digest)
+
+            log_message("reading plugins schema file", detail=str(plugins_schema_file))
+            plugin_validator = schema_validator(plugins_schema_content, plugins_schema_digest)
+
+            log_message("validating plugins")
+            plugin_validator.validate(plugin_data)
+
+            log_message("converting plugins to markup")
+            doc_cache[cache_key] = [render_plugin(plugin) for plugin in plugin_data]
+
+        return [nodes.raw(text=tag, format="html") for tag in doc_cache[cache_key]]
+
+
+def init_markup_cache(app: Sphinx, env: BuildEnvironment, docnames: list[str]) -> None:
+    """Make sure the build environment holds the cache of rendered plugin markup.
+
+    The cache maps document names to the markup rendered for them. It is pickled with
+    the environment and thus survives between builds.
+    """
+    if not hasattr(env, "plugin_markup_cache"):
+        env.plugin_markup_cache = {}
+    if not hasattr(env, "plugin_markup_previous"):
+        env.plugin_markup_previous = {}
+
+
+def purge_markup_cache(app: Sphinx, env: BuildEnvironment, docname: str) -> None:
+    """Set aside the markup of a document that is re-read (or was removed).
+
+    While the document is read again, the directive can still reuse this markup if
+    nothing it depends on has changed.
+    """
+    init_markup_cache(app, env, [])
+    env.plugin_markup_previous[docname] = env.plugin_markup_cache.pop(docname, {})
+
 
-        log_message("validating plugins")
-        validate(plugin_data, plugin_schema)
+def merge_markup_cache(
+    app: Sphinx, env: BuildEnvironment, docnames: list[str], other: BuildEnvironment
+) -> None:
+    """Collect markup rendered by parallel reader processes."""
+    other_cache = getattr(other, "plugin_markup_cache", {})
+    for docname in docnames:
+        if docname in other_cache:
+            env.plugin_markup_cache[docname] = other_cache[docname]
 
-        log_message("converting plugins to markup")
-        tags = []
-        for plugin in plugin_data:
-            markup = plugin_to_schema_org(plugin).model_dump_jsonld()
-            tag = f'<script type="application/ld+json">{markup}</script>'
-            tags.append(nodes.raw(text=tag, format="html"))
 
-        return tags
+def drop_previous_markup(app: Sphinx, env: BuildEnvironment) -> list[str]:
+    """Forget markup that was not reused, so it is not pickled with the environment."""
+    env.plugin_markup_previous = {}
+    return []
 
 
 def setup(app: Sphinx):
     """Wire up the directive so that it can be used as ``plugin-markup``."""
     app.add_directive("plugin-markup", PluginMarkupDirective)
+    app.connect("env-before-read-docs", init_markup_cache)
+    app.connect("env-purge-doc", purge_markup_cache)
+    app.connect("env-merge-info", merge_markup_cache)
+    app.connect("env-updated", drop_previous_markup)
     return {
         "version": "0.1",
+        "env_version": 2,
         "parallel_read_safe": True,
         "parallel_write_safe": True,
     }
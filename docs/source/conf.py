@@ -22,11 +22,13 @@
 #
 import os
 import sys
-import toml
+import tomllib
+from functools import lru_cache
 
 sys.path.insert(0, os.path.abspath('../../src'))
 sys.path.append(os.path.abspath('_ext'))
 
+@lru_cache(maxsize=1)
 def read_from_pyproject(file_path="../../pyproject.toml"):
     """
     Reads the metadata from the pyproject.toml file.
@@ -36,7 +38,8 @@ def read_from_pyproject(file_path="../../pyproject.toml"):
     """
     try:
         # Load the pyproject.toml file
-        data = toml.load(file_path)
+        with open(file_path, "rb") as pyproject_file:
+            data = tomllib.load(pyproject_file)
 
         # Navigate to the authors metadata
         metadata = data.get("tool", {}).get("poetry", {})
@@ -45,7 +48,7 @@ def read_from_pyproject(file_path="../../pyproject.toml"):
         return metadata
     except FileNotFoundError:
         return f"The file {file_path} was not found."
-    except toml.TomlDecodeError:
+    except tomllib.TOMLDecodeError:
         return f"Failed to parse {file_path}. Ensure it is a valid TOML file."
     except Exception as e:
         return f"An unexpected error occurred: {e}"
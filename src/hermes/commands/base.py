@@ -6,15 +6,48 @@
 
 import abc
 import argparse
+import functools
 import logging
+import operator
 import pathlib
+import tomllib
+from collections.abc import Iterable, Iterator, Mapping
 from importlib import metadata
 from typing import Dict, Optional, Type
 
-import toml
-from pydantic import BaseModel
+from pydantic import BaseModel, create_model
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
+from hermes.utils import hermes_version
+
+
+@functools.lru_cache(maxsize=1)
+def _entry_points() -> metadata.EntryPoints:
+    """Collect all installed entry points once, so that all commands share a single metadata scan."""
+    return metadata.entry_points()
+
+
+class _LazyPlugins(Mapping):
+    """Mapping of plugin names to plugin classes that loads each entry point on first access only.
+
+    This avoids importing the modules (and dependencies) of plugins that are never used in a run.
+    """
+
+    def __init__(self, entry_points: Iterable[metadata.EntryPoint]):
+        self._entry_points = {entry_point.name: entry_point for entry_point in entry_points}
+        self._loaded = {}
+
+    def __getitem__(self, name: str) -> Type:
+        if name not in self._loaded:
+            self._loaded[name] = self._entry_points[name].load()
+        return self._loaded[name]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._entry_points)
+
+    def __len__(self) -> int:
+        return len(self._entry_points)
+
 
 class _HermesSettings(BaseSettings):
     """Root class for HERMES configuration model."""
@@ -28,10 +61,13 @@ class HermesCommand(abc.ABC):
     """Base class for a HERMES workflow command.
 
     :cvar NAME: The name of the sub-command that is defined here.
+    :cvar needs_settings: Whether the sub-command reads the configuration. If not, no settings model is built and
+                          no settings are loaded before it runs.
     """
 
     command_name: str = ""
     settings_class: Type = _HermesSettings
+    needs_settings: bool = True
 
     def __init__(self, parser: argparse.ArgumentParser):
         """Initialize a new instance of any HERMES command.
@@ -46,25 +82,29 @@ class HermesCommand(abc.ABC):
         self.errors = []
 
     @classmethod
-    def init_plugins(cls):
-        """Collect and initialize the plugins available for the HERMES command."""
+    def init_plugins(cls) -> Mapping[str, Type]:
+        """Collect the plugins available for the HERMES command.
+
+        The plugins are only loaded when they are accessed for the first time.
+        """
 
         # Collect all entry points for this group (i.e., all valid plug-ins for the step)
         entry_point_group = f"hermes.{cls.command_name}"
-        group_plugins = {
-            entry_point.name: entry_point.load()
-            for entry_point in metadata.entry_points(group=entry_point_group)
-        }
+        return _LazyPlugins(_entry_points().select(group=entry_point_group))
+
+    def init_settings_class(self) -> None:
+        """Extend the settings model of this command by the settings of its plugins.
+
+        This needs to load all plugins of the command, hence it should only be called for the command that is run.
+        """
 
         # Collect the plug-in specific configurations
-        cls.derive_settings_class({
+        self.derive_settings_class({
             plugin_name: plugin_class.settings_class
-            for plugin_name, plugin_class in group_plugins.items()
+            for plugin_name, plugin_class in self.plugins.items()
             if hasattr(plugin_class, "settings_class") and plugin_class.settings_class is not None
         })
 
-        return group_plugins
-
     @classmethod
     def derive_settings_class(cls, setting_types: Dict[str, Type]) -> None:
         """Build a new Pydantic data model class for configuration.
@@ -73,17 +113,19 @@ class HermesCommand(abc.ABC):
         """
 
         if cls.settings_class is not None:
+            # Always derive from the settings class as declared by the command, so that repeated calls
+            # replace the plug-in extensions instead of stacking them.
+            base = cls.__dict__.get("_base_settings_class", cls.settings_class)
+            cls._base_settings_class = base
+
             # Derive a new settings model class that contains all the plug-in extensions
-            cls.settings_class = type(
+            cls.settings_class = create_model(
                 f"{cls.__name__}Settings",
-                (cls.settings_class, ),
-                {
-                    **{
-                        plugin_name: plugin_settings()
-                        for plugin_name, plugin_settings in setting_types.items()
-                        if plugin_settings is not None
-                    },
-                    "__annotations__": setting_types,
+                __base__=base,
+                **{
+                    plugin_name: (plugin_settings, plugin_settings())
+                    for plugin_name, plugin_settings in setting_types.items()
+                    if plugin_settings is not None
                 },
             )
         elif setting_types:
@@ -132,7 +174,8 @@ class HermesCommand(abc.ABC):
     def load_settings(self, args: argparse.Namespace):
         """Load settings from the configuration file (passed in from command line)."""
         try:
-            toml_data = toml.load(args.path / args.config)
+            with open(args.path / args.config, "rb") as config_file:
+                toml_data = tomllib.load(config_file)
             self.root_settings = HermesCommand.settings_class.model_validate(toml_data)
             self.settings = getattr(self.root_settings, self.command_name)
         except FileNotFoundError as e:
@@ -143,13 +186,15 @@ class HermesCommand(abc.ABC):
         """Process command line options for the settings."""
 
         for key, value in args.options:
-            target = self.settings
-            sub_keys = key.split('.')
-            for sub_key in sub_keys[:-1]:
-                target = getattr(target, sub_key)
+            *parent_keys, name = key.split('.')
+            target = operator.attrgetter('.'.join(parent_keys))(self.settings) if parent_keys else self.settings
 
-            # TODO: Transform the value accordingly before setting it
-            setattr(target, sub_keys[-1], value)
+            # Convert and check the value against the declared field of the option (if known),
+            # including its constraints
+            if isinstance(target, BaseModel) and name in type(target).model_fields:
+                type(target).__pydantic_validator__.validate_assignment(target, name, value)
+            else:
+                setattr(target, name, value)
 
     @abc.abstractmethod
     def __call__(self, args: argparse.Namespace):
@@ -188,6 +233,7 @@ class HermesHelpCommand(HermesCommand):
 
     command_name = "help"
     settings_class = HermesHelpSettings
+    needs_settings = False
 
     def init_command_parser(self, command_parser: argparse.ArgumentParser) -> None:
         command_parser.add_argument(
@@ -221,11 +267,12 @@ class HermesVersionCommand(HermesCommand):
 
     command_name = "version"
     settings_class = HermesVersionSettings
+    needs_settings = False
 
     def load_settings(self, args: argparse.Namespace):
         """Pass loading settings as not necessary for this command."""
         pass
 
     def __call__(self, args: argparse.Namespace) -> None:
-        self.log.info(metadata.version("hermes"))
+        self.log.info(hermes_version)
         self.parser.exit()
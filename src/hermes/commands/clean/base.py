@@ -22,12 +22,16 @@ class HermesCleanCommand(HermesCommand):
 
     command_name = "clean"
     settings_class = _HermesCleanSettings
+    needs_settings = False
 
     def __call__(self, args: argparse.Namespace) -> None:
         self.log.info("Removing HERMES caches...")
 
         # Naive implementation for now... check errors, validate directory, don't construct the path ourselves, etc.
-        shutil.rmtree(args.path / '.hermes')
+        try:
+            shutil.rmtree(args.path / '.hermes')
+        except FileNotFoundError:
+            self.log.info("No HERMES caches found.")
 
     def load_settings(self, args: argparse.Namespace):
         """No settings are needed for the clean command."""
@@ -34,44 +34,51 @@ def main() -> None:
     # Register all sub-commands to a new sub-parser each.
     subparsers = parser.add_subparsers(dest="subcommand", required=True,
                                        help="Available subcommands")
-    setting_types = {}
-
-    for command in (
-            HermesHelpCommand(parser),
-            HermesVersionCommand(parser),
-            HermesInitCommand(parser),
-            HermesCleanCommand(parser),
-            HermesHarvestCommand(parser),
-            HermesProcessCommand(parser),
-            HermesCurateCommand(parser),
-            HermesDepositCommand(parser),
-            HermesPostprocessCommand(parser),
-    ):
-        if command.settings_class is not None:
-            setting_types[command.command_name] = command.settings_class
+    commands = (
+        HermesHelpCommand(parser),
+        HermesVersionCommand(parser),
+        HermesInitCommand(parser),
+        HermesCleanCommand(parser),
+        HermesHarvestCommand(parser),
+        HermesProcessCommand(parser),
+        HermesCurateCommand(parser),
+        HermesDepositCommand(parser),
+        HermesPostprocessCommand(parser),
+    )
 
+    for command in commands:
         command_parser = subparsers.add_parser(command.command_name, help=command.__doc__)
         command_parser.set_defaults(command=command)
 
         command.init_common_parser(command_parser)
         command.init_command_parser(command_parser)
 
-    # Construct the Pydantic Settings root model
-    HermesCommand.derive_settings_class(setting_types)
-
     # Actually parse the command line, configure it and execute the selected sub-command.
     args = parser.parse_args()
 
+    # Commands that work without any configuration can skip building the settings model.
+    if args.command.needs_settings:
+        # Only the selected sub-command needs the settings of its plug-ins (and hence its plug-ins loaded).
+        args.command.init_settings_class()
+
+        # Construct the Pydantic Settings root model
+        HermesCommand.derive_settings_class({
+            command.command_name: command.settings_class
+            for command in commands
+            if command.settings_class is not None
+        })
+
     logger.init_logging()
     log = logger.getLogger("hermes.cli")
     log.debug("Running hermes with the following command line arguments: %s", mask_options_values(args))
 
     try:
-        log.debug("Loading settings...")
-        args.command.load_settings(args)
+        if args.command.needs_settings:
+            log.debug("Loading settings...")
+            args.command.load_settings(args)
 
-        log.debug("Update settings from command line...")
-        args.command.patch_settings(args)
+            log.debug("Update settings from command line...")
+            args.command.patch_settings(args)
 
         log.info("Run subcommand %s", args.command.command_name)
         args.command(args)
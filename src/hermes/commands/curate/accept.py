@@ -5,7 +5,6 @@
 # SPDX-FileContributor: Michael Meinel
 # SPDX-FileContributor: David Pape
 
-import os
 import shutil
 
 from hermes.commands.curate.base import BaseCuratePlugin
@@ -25,12 +24,6 @@ class AcceptCuratePlugin(BaseCuratePlugin):
 
     def process_decision_positive(self):
         """In case of positive curation result, copy files to next step."""
-        process_output = (
-            self.ctx.hermes_dir / "process" / (self.ctx.hermes_name + ".json")
-        )
-
-        os.makedirs(self.ctx.hermes_dir / "curate", exist_ok=True)
-        shutil.copy(
-            process_output,
-            self.ctx.hermes_dir / "curate" / (self.ctx.hermes_name + ".json"),
-        )
+        process_output = self.ctx.get_cache("process", self.ctx.hermes_name)
+        curate_output = self.ctx.get_cache("curate", self.ctx.hermes_name, create=True)
+        shutil.copyfile(process_output, curate_output)
@@ -7,6 +7,7 @@
 # SPDX-FileContributor: Stephan Druskat
 
 import json
+import pathlib
 
 from pydantic import BaseModel
 
@@ -15,7 +16,14 @@ from hermes.model.path import ContextPath
 
 
 class FileDepositSettings(BaseModel):
+    """Settings for the ``file`` deposit target.
+
+    ``filename`` is the path the metadata is written to. ``pretty`` selects two-space indented JSON (the default);
+    set it to ``false`` to write compact JSON, which is smaller and faster to write for large metadata.
+    """
+
     filename: str = 'hermes.json'
+    pretty: bool = True
 
 
 class FileDepositPlugin(BaseDepositPlugin):
@@ -28,5 +36,9 @@ class FileDepositPlugin(BaseDepositPlugin):
         file_config = self.command.settings.file
         output_data = self.ctx['deposit.file']
 
-        with open(file_config.filename, 'w') as deposition_file:
-            json.dump(output_data, deposition_file, indent=2)
+        # Indented output forces json to use its (slower) pure-Python encoder, so compact output can be chosen.
+        if file_config.pretty:
+            output = json.dumps(output_data, indent=2)
+        else:
+            output = json.dumps(output_data, separators=(',', ':'))
+        pathlib.Path(file_config.filename).write_text(output)
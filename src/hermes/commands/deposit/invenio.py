@@ -6,16 +6,21 @@
 # SPDX-FileContributor: Oliver Bertuch
 # SPDX-FileContributor: Michael Meinel
 
+import functools
+import itertools
 import json
 import logging
 import pathlib
 import typing as t
+from concurrent.futures import ThreadPoolExecutor
 from datetime import date, datetime
 from pathlib import Path
 from urllib.parse import urlparse
 
 import requests
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
+from requests.adapters import HTTPAdapter
+from urllib3.util import Retry
 
 from hermes.commands.deposit.base import BaseDepositPlugin, HermesDepositCommand
 from hermes.commands.deposit.error import DepositionUnauthorizedError
@@ -34,6 +39,10 @@ class InvenioClient(requests.Session):
     DEFAULT_DEPOSITIONS_API_PATH = "api/deposit/depositions"
     DEFAULT_RECORDS_API_PATH = "api/records"
 
+    # (connect, read) timeout in seconds. The read timeout is generous, as the server may need some time to process
+    # large uploads before it answers.
+    DEFAULT_TIMEOUT = (10, 300)
+
     # Used for context path and config
     platform_name = "invenio"
 
@@ -46,6 +55,22 @@ class InvenioClient(requests.Session):
         self.config = config
         self.headers.update({"User-Agent": hermes_user_agent})
 
+        # Retry transient server errors, but only for idempotent requests without body: uploads stream from open
+        # files that cannot be replayed.
+        adapter = HTTPAdapter(
+            pool_maxsize=max(requests.adapters.DEFAULT_POOLSIZE, self.config.upload_workers),
+            max_retries=Retry(
+                total=3,
+                backoff_factor=0.3,
+                status_forcelist=(429, 500, 502, 503, 504),
+                allowed_methods=("GET", "HEAD"),
+                # Hand the last response to the callers, which report the server's error message
+                raise_on_status=False,
+            ),
+        )
+        self.mount("https://", adapter)
+        self.mount("http://", adapter)
+
         self.auth_token = auth_token
         self.site_url = self.config.site_url
         if not self.site_url:
@@ -54,12 +79,16 @@ class InvenioClient(requests.Session):
     def request(self, method, url, headers=None, **kwargs) -> requests.Response:
         """Overridden request method to automatically set Authorization header for all requests to the configured site.
 
+        Requests without an explicit ``timeout`` use :attr:`DEFAULT_TIMEOUT` so that an unresponsive server cannot
+        block the deposition forever.
+
         See [requests documentation](https://requests.readthedocs.io/en/latest/api.html#requests.request) for details.
         """
 
         if self.auth_token:
             if urlparse(self.site_url).hostname == urlparse(url).hostname:
                 headers = (headers or {}) | {"Authorization": f"Bearer {self.auth_token}"}
+        kwargs.setdefault("timeout", self.DEFAULT_TIMEOUT)
         return super().request(method, url, headers=headers, **kwargs)
 
     def get_record(self, record_id):
@@ -246,6 +275,7 @@ class InvenioDepositSettings(BaseModel):
     api_paths: t.Dict = {}
     auth_token: str = ''
     files: list[pathlib.Path] = []
+    upload_workers: int = Field(4, ge=1)
 
     record_id: int = None
     doi: str = None
@@ -346,8 +376,9 @@ class InvenioDepositPlugin(BaseDepositPlugin):
         self.ctx.update(self.invenio_context_path["depositionMetadata"], deposition_metadata)
 
         # Store a snapshot of the mapped data within the cache, useful for analysis, debugging, etc
-        with open(self.ctx.get_cache("deposit", self.platform_name, create=True), 'w') as invenio_json:
-            json.dump(deposition_metadata, invenio_json, indent='  ')
+        self.ctx.get_cache("deposit", self.platform_name, create=True).write_text(
+            json.dumps(deposition_metadata, indent='  ')
+        )
 
     def is_initial_publication(self) -> bool:
         latest_record_id = self.invenio_ctx.get("latestRecord", {}).get("id")
@@ -426,8 +457,7 @@ class InvenioDepositPlugin(BaseDepositPlugin):
         self.links.update(deposit["links"])
 
         _log.debug("Created new version deposit: %s", self.links["html"])
-        with open(self.ctx.get_cache('deposit', 'deposit', create=True), 'w') as deposit_file:
-            json.dump(deposit, deposit_file, indent=4)
+        self.ctx.get_cache('deposit', 'deposit', create=True).write_text(json.dumps(deposit, indent=4))
 
     def delete_artifacts(self) -> None:
         """Delete existing file artifacts.
@@ -448,24 +478,32 @@ class InvenioDepositPlugin(BaseDepositPlugin):
 
         bucket_url = self.links["bucket"]
 
-        files = *self.config.files, *[f[0] for f in self.command.args.file]
-        for path_arg in files:
-            path = Path(path_arg)
-
+        # ``--file`` is not set at all if it was not given on the command line
+        file_args = self.command.args.file or []
+        files = [Path(path_arg) for path_arg in itertools.chain(self.config.files, (f[0] for f in file_args))]
+        for path in files:
             # This should not happen, as Click shall not accept dirs as arguments already. Zero trust anyway.
             if not path.is_file():
                 raise ValueError(f"{path}: Any given argument to be included in the deposit must be a file.")
 
-            with open(path, "rb") as file_content:
-                response = self.client.put(
-                    f"{bucket_url}/{path.name}", data=file_content,
-                )
-                if not response.ok:
-                    _log.error("Server answered with error code %d:\n%s", response.status_code, response.text)
-                    raise RuntimeError(f"Could not upload file {path.name!r} into bucket {bucket_url!r}")
+        # The uploads are independent of each other, so they can run concurrently. Collecting the results
+        # re-raises the first error of any upload here.
+        with ThreadPoolExecutor(max_workers=self.config.upload_workers) as executor:
+            list(executor.map(functools.partial(self._upload_file, bucket_url), files))
+
+    def _upload_file(self, bucket_url: str, path: Path) -> None:
+        """Upload a single file artifact into the bucket of the deposit."""
 
-            # This can potentially be used to verify the checksum
-            # file_resource = response.json()
+        with open(path, "rb") as file_content:
+            response = self.client.put(
+                f"{bucket_url}/{path.name}", data=file_content,
+            )
+            if not response.ok:
+                _log.error("Server answered with error code %d:\n%s", response.status_code, response.text)
+                raise RuntimeError(f"Could not upload file {path.name!r} into bucket {bucket_url!r}")
+
+        # This can potentially be used to verify the checksum
+        # file_resource = response.json()
 
     def publish(self) -> None:
         """Publish the deposited record."""
@@ -512,40 +550,13 @@ class InvenioDepositPlugin(BaseDepositPlugin):
         embargo_date = self.invenio_ctx["embargo_date"]
         access_conditions = self.invenio_ctx["access_conditions"]
 
-        creators = [
-            # TODO: Distinguish between @type "Person" and others
-            {
-                k: v for k, v in {
-                    # TODO: This is ugly
-                    "affiliation": author.get("affiliation", {"legalName": None}).get("legalName"),
-                    # Invenio wants "family, given". author.get("name") might not have this format.
-                    "name": f"{author.get('familyName')}, {author.get('givenName')}"
-                    if author.get("familyName") and author.get("givenName")
-                    else author.get("name"),
-                    # Invenio expects the ORCID without the URL part
-                    "orcid": author.get("@id", "").replace("https://orcid.org/", "") or None,
-                }.items() if v is not None
-            }
-            for author in metadata["author"]
-        ]
+        # TODO: Distinguish between @type "Person" and others
+        creators = [self._person(author) for author in metadata["author"]]
 
         # This is not used at the moment. See comment below in `deposition_metadata` dict.
         contributors = [  # noqa: F841
-            # TODO: Distinguish between @type "Person" and others
-            {
-                k: v for k, v in {
-                    # TODO: This is ugly
-                    "affiliation": contributor.get("affiliation", {"legalName": None}).get("legalName"),
-                    # Invenio wants "family, given". contributor.get("name") might not have this format.
-                    "name": f"{contributor.get('familyName')}, {contributor.get('givenName')}"
-                    if contributor.get("familyName") and contributor.get("givenName")
-                    else contributor.get("name"),
-                    # Invenio expects the ORCID without the URL part
-                    "orcid": contributor.get("@id", "").replace("https://orcid.org/", "") or None,
-                    # TODO: Many possibilities here. Get from config
-                    "type": "ProjectMember",
-                }.items() if v is not None
-            }
+            # TODO: Many possibilities here. Get from config
+            self._person(contributor, type="ProjectMember")
             # TODO: Filtering out "GitHub" should be done elsewhere
             for contributor in metadata.get("contributor", []) if contributor.get("name") != "GitHub"
         ]
@@ -599,6 +610,37 @@ class InvenioDepositPlugin(BaseDepositPlugin):
 
         return deposition_metadata
 
+    @staticmethod
+    def _person(person: dict, **extra) -> dict:
+        """Map a CodeMeta person onto an Invenio creator or contributor.
+
+        :param person: The CodeMeta person (i.e., an author or contributor).
+        :param extra: Additional fields to set on the resulting entry (e.g., the contributor ``type``).
+        :return: The Invenio representation, without any fields that have no value.
+        """
+
+        invenio_person = {}
+
+        # TODO: This is ugly
+        affiliation = (person.get("affiliation") or {}).get("legalName")
+        if affiliation is not None:
+            invenio_person["affiliation"] = affiliation
+
+        # Invenio wants "family, given". person.get("name") might not have this format.
+        family_name = person.get("familyName")
+        given_name = person.get("givenName")
+        name = f"{family_name}, {given_name}" if family_name and given_name else person.get("name")
+        if name is not None:
+            invenio_person["name"] = name
+
+        # Invenio expects the ORCID without the URL part
+        orcid = person.get("@id", "").removeprefix("https://orcid.org/")
+        if orcid:
+            invenio_person["orcid"] = orcid
+
+        invenio_person.update(extra)
+        return invenio_person
+
     def _get_license_identifier(self) -> t.Optional[str]:
         """Get Invenio license identifier that matches the given license URL.
 
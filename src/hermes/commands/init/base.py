@@ -3,6 +3,7 @@
 # SPDX-FileContributor: Nitai Heeb
 
 import argparse
+import functools
 import logging
 import os
 import re
@@ -13,18 +14,20 @@ from dataclasses import dataclass
 from enum import Enum, auto
 from importlib import metadata
 from pathlib import Path
+from typing import TYPE_CHECKING
 from urllib.parse import urljoin, urlparse
 
-import requests
 import toml
 from pydantic import BaseModel
-from requests import HTTPError
 
 import hermes.commands.init.util.slim_click as sc
-from hermes.commands import marketplace
 from hermes.commands.base import HermesCommand, HermesPlugin
-from hermes.commands.init.util import (connect_github, connect_gitlab,
-                                       connect_zenodo, git_info)
+from hermes.commands.init.util import git_info
+
+# The network related modules (requests, the OAuth connectors, and the marketplace) are imported where they are
+# used. This keeps them out of the start-up of every other ``hermes`` sub-command.
+if TYPE_CHECKING:
+    from hermes.commands import marketplace
 
 TUTORIAL_URL = "https://hermes.software-metadata.pub/en/latest/tutorials/automated-publication-with-ci.html"
 
@@ -102,12 +105,17 @@ def get_git_hoster_from_url(url: str) -> GitHoster:
     git_base_url = f"{parsed_url.scheme}://{parsed_url.netloc}/"  # noqa E231
     if "github.com" in url:
         return GitHoster.GitHub
-    elif connect_gitlab.is_url_gitlab(git_base_url):
+
+    from hermes.commands.init.util import connect_gitlab
+    if connect_gitlab.is_url_gitlab(git_base_url):
         return GitHoster.GitLab
     return GitHoster.Empty
 
 
 def download_file_from_url(url, filepath, append: bool = False) -> None:
+    import requests
+    from requests import HTTPError
+
     try:
         with requests.get(url, stream=True) as r:
             r.raise_for_status()
@@ -158,6 +166,7 @@ class HermesInitCommand(HermesCommand):
     """ Install HERMES onto a project. """
     command_name = "init"
     settings_class = _HermesInitSettings
+    needs_settings = False
 
     def __init__(self, parser: argparse.ArgumentParser):
         super().__init__(parser)
@@ -194,9 +203,13 @@ class HermesInitCommand(HermesCommand):
             }
         }
         self.plugin_relevant_commands = ["harvest", "deposit"]
-        self.builtin_plugins: dict[str: HermesPlugin] = get_builtin_plugins(self.plugin_relevant_commands)
         self.selected_plugins: list[marketplace.PluginInfo] = []
 
+    @functools.cached_property
+    def builtin_plugins(self) -> dict[str: HermesPlugin]:
+        """The installed plugins for the relevant commands, only loaded on first access."""
+        return get_builtin_plugins(self.plugin_relevant_commands)
+
     def init_command_parser(self, command_parser: argparse.ArgumentParser) -> None:
         command_parser.add_argument('--template-branch', nargs=1, default="",
                                     help="Branch or tag of the ci-templates repository.")
@@ -496,6 +509,7 @@ class HermesInitCommand(HermesCommand):
             if self.setup_method == "m":
                 sc.press_enter_to_continue()
             else:
+                from hermes.commands.init.util import connect_zenodo
                 while True:
                     self.tokens[self.deposit_platform] = sc.answer("Enter the token here: ")
                     valid = connect_zenodo.test_if_token_is_valid(self.tokens[self.deposit_platform])
@@ -520,6 +534,7 @@ class HermesInitCommand(HermesCommand):
     def configure_github(self) -> None:
         oauth_success = False
         if self.setup_method == "a":
+            from hermes.commands.init.util import connect_github
             self.tokens[GitHoster.GitHub] = connect_github.get_access_token()
             if self.tokens[GitHoster.GitHub]:
                 sc.echo("OAuth at GitHub was successful.", formatting=sc.Formats.OKGREEN)
@@ -555,6 +570,7 @@ class HermesInitCommand(HermesCommand):
         # Doing it with API / OAuth
         oauth_success = False
         if self.setup_method == "a":
+            from hermes.commands.init.util import connect_gitlab
             gl = connect_gitlab.GitLabConnection(self.git_remote_url)
             token = ""
             if not gl.has_client():
@@ -636,6 +652,7 @@ class HermesInitCommand(HermesCommand):
     def connect_deposit_platform(self) -> None:
         """Acquires the access token of the chosen deposit platform."""
         assert self.deposit_platform != DepositPlatform.Empty
+        from hermes.commands.init.util import connect_zenodo
         match self.deposit_platform:
             case DepositPlatform.Zenodo:
                 connect_zenodo.setup(using_sandbox=False)
@@ -646,6 +663,7 @@ class HermesInitCommand(HermesCommand):
 
     def choose_plugins(self) -> None:
         """User chooses the plugins he wants to use."""
+        from hermes.commands import marketplace
         plugin_infos: list[marketplace.PluginInfo] = marketplace.get_plugin_infos()
         plugins_builtin: list[marketplace.PluginInfo] = list(filter(lambda p: p.builtin, plugin_infos))
         plugins_available: list[marketplace.PluginInfo] = list(filter(lambda p: not p.builtin, plugin_infos))
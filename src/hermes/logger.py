@@ -8,6 +8,18 @@ import logging
 import pathlib
 
 
+class _LazyFileHandler(logging.FileHandler):
+    """File handler that creates the directory of its log file only when the first record is written.
+
+    Together with ``delay=True`` this keeps commands from creating files (or the ``.hermes`` directory) they never
+    log to.
+    """
+
+    def _open(self):
+        pathlib.Path(self.baseFilename).parent.mkdir(exist_ok=True, parents=True)
+        return super()._open()
+
+
 # This is the default logging configuration, required to see log output at all.
 #  - Maybe it could possibly somehow be a somewhat good idea to move this into an own module ... later perhaps
 _logging_config = {
@@ -28,18 +40,20 @@ _logging_config = {
         },
 
         'logfile': {
-            'class': "logging.FileHandler",
+            'class': "hermes.logger._LazyFileHandler",
             'formatter': "logfile",
             'level': "DEBUG",
             'filename': "./hermes.log",
+            'delay': True,
         },
 
         'auditfile': {
-            'class': "logging.FileHandler",
+            'class': "hermes.logger._LazyFileHandler",
             'formatter': "plain",
             'level': "DEBUG",
             'filename': "./.hermes/audit.log",
             'mode': "w",
+            'delay': True,
         },
     },
 
@@ -57,10 +71,6 @@ def init_logging():
     if _loggers:
         return
 
-    # Make sure the directories to hold the log files exists (or else create)
-    pathlib.Path(_logging_config['handlers']['logfile']['filename']).parent.mkdir(exist_ok=True, parents=True)
-    pathlib.Path(_logging_config['handlers']['auditfile']['filename']).parent.mkdir(exist_ok=True, parents=True)
-
     # Inintialize logging system
     import logging.config
 
@@ -0,0 +1,23 @@
+# SPDX-FileCopyrightText: 2026 German Aerospace Center (DLR)
+#
+# SPDX-License-Identifier: Apache-2.0
+
+import logging
+from argparse import Namespace
+
+from hermes.commands.clean.base import HermesCleanCommand
+
+
+def test_clean_removes_cache(tmp_path):
+    (tmp_path / ".hermes" / "harvest").mkdir(parents=True)
+
+    HermesCleanCommand(None)(Namespace(path=tmp_path))
+
+    assert not (tmp_path / ".hermes").exists()
+
+
+def test_clean_without_cache(tmp_path, caplog):
+    with caplog.at_level(logging.INFO, logger="hermes.clean"):
+        HermesCleanCommand(None)(Namespace(path=tmp_path))
+
+    assert "No HERMES caches found." in caplog.messages
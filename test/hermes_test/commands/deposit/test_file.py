@@ -0,0 +1,26 @@
+# SPDX-FileCopyrightText: 2026 German Aerospace Center (DLR)
+#
+# SPDX-License-Identifier: Apache-2.0
+
+from types import SimpleNamespace
+
+from hermes.commands.deposit.file import FileDepositPlugin, FileDepositSettings
+
+
+def _publish(tmp_path, **settings):
+    output_path = tmp_path / "hermes.json"
+    command = SimpleNamespace(settings=SimpleNamespace(file=FileDepositSettings(filename=str(output_path), **settings)))
+    ctx = {"deposit.file": {"name": "Test", "author": [{"name": "Jane Doe"}]}}
+
+    FileDepositPlugin(command, ctx).publish()
+    return output_path.read_text()
+
+
+def test_publish_pretty_by_default(tmp_path):
+    assert _publish(tmp_path) == (
+        '{\n  "name": "Test",\n  "author": [\n    {\n      "name": "Jane Doe"\n    }\n  ]\n}'
+    )
+
+
+def test_publish_compact(tmp_path):
+    assert _publish(tmp_path, pretty=False) == '{"name":"Test","author":[{"name":"Jane Doe"}]}'
@@ -5,6 +5,7 @@
 # SPDX-FileContributor: Michael Meinel
 # SPDX-FileContributor: David Pape
 
+from types import SimpleNamespace
 from unittest import mock
 
 import click
@@ -40,6 +41,50 @@ def depositor():
     return d
 
 
+@pytest.fixture
+def uploader(tmp_path):
+    files = []
+    for name in ("a.txt", "b.txt", "c.txt"):
+        (tmp_path / name).write_text(name)
+        files.append(tmp_path / name)
+
+    settings = invenio.InvenioDepositSettings(
+        site_url="https://invenio.example.com", auth_token="secret", files=files, upload_workers=2,
+    )
+    command = SimpleNamespace(settings=SimpleNamespace(invenio=settings), args=SimpleNamespace(file=None))
+    plugin = invenio.InvenioDepositPlugin(command, None)
+    plugin.links["bucket"] = "https://invenio.example.com/api/files/bucket"
+    return plugin
+
+
+def test_upload_artifacts(requests_mock, uploader):
+    uploaded = {}
+
+    def _store(request, context):
+        uploaded[request.path] = request.body.read()
+        return {}
+
+    for name in ("a.txt", "b.txt", "c.txt"):
+        requests_mock.put(f"https://invenio.example.com/api/files/bucket/{name}", json=_store)
+
+    uploader.upload_artifacts()
+
+    assert uploaded == {
+        "/api/files/bucket/a.txt": b"a.txt",
+        "/api/files/bucket/b.txt": b"b.txt",
+        "/api/files/bucket/c.txt": b"c.txt",
+    }
+
+
+def test_upload_artifacts_error(requests_mock, uploader):
+    requests_mock.put("https://invenio.example.com/api/files/bucket/a.txt", json={})
+    requests_mock.put("https://invenio.example.com/api/files/bucket/b.txt", status_code=403)
+    requests_mock.put("https://invenio.example.com/api/files/bucket/c.txt", json={})
+
+    with pytest.raises(RuntimeError, match="b.txt"):
+        uploader.upload_artifacts()
+
+
 @pytest.mark.skip(reason="pydantic-settings need to be refactored")
 def test_resolve_doi(requests_mock, resolver):
     requests_mock.get('https://doi.org/123.45/foo.bar-6789',
@@ -182,3 +227,49 @@ def test_get_access_modalities_broken_access_right(depositor):
     })
     with pytest.raises(MisconfigurationError):
         depositor._get_access_modalities(None)
+
+
+@pytest.mark.parametrize(
+    "person,extra,expected",
+    [
+        (
+            {"givenName": "Jane", "familyName": "Doe", "name": "Jane Doe"},
+            {},
+            {"name": "Doe, Jane"},
+        ),
+        ({"givenName": "Jane", "name": "Jane Doe"}, {}, {"name": "Jane Doe"}),
+        (
+            {"name": "Jane Doe", "@id": "https://orcid.org/0000-0001-2345-6789"},
+            {},
+            {"name": "Jane Doe", "orcid": "0000-0001-2345-6789"},
+        ),
+        (
+            {"name": "Jane Doe", "@id": "https://example.com/jane"},
+            {},
+            {"name": "Jane Doe", "orcid": "https://example.com/jane"},
+        ),
+        ({"name": "Jane Doe", "@id": ""}, {}, {"name": "Jane Doe"}),
+        (
+            {"name": "Jane Doe", "affiliation": {"legalName": "DLR"}},
+            {},
+            {"affiliation": "DLR", "name": "Jane Doe"},
+        ),
+        ({"name": "Jane Doe", "affiliation": None}, {}, {"name": "Jane Doe"}),
+        ({"name": "Jane Doe", "affiliation": {}}, {}, {"name": "Jane Doe"}),
+        ({}, {}, {}),
+        ({"name": "Jane Doe"}, {"type": "ProjectMember"}, {"name": "Jane Doe", "type": "ProjectMember"}),
+    ]
+)
+def test_person(person, extra, expected):
+    assert invenio.InvenioDepositPlugin._person(person, **extra) == expected
+
+
+def test_person_keeps_field_order():
+    person = {
+        "@id": "https://orcid.org/0000-0001-2345-6789",
+        "name": "Jane Doe",
+        "affiliation": {"legalName": "DLR"},
+    }
+    assert list(invenio.InvenioDepositPlugin._person(person, type="ProjectMember")) == [
+        "affiliation", "name", "orcid", "type",
+    ]
@@ -0,0 +1,94 @@
+# SPDX-FileCopyrightText: 2026 German Aerospace Center (DLR)
+#
+# SPDX-License-Identifier: Apache-2.0
+
+from argparse import Namespace
+
+import pytest
+from pydantic import BaseModel, Field, ValidationError
+
+from hermes.commands.base import HermesCommand
+
+
+@pytest.fixture
+def command_class():
+    """Factory for minimal commands using the given settings model."""
+
+    def _make(settings_model):
+        class _Command(HermesCommand):
+            command_name = "test"
+            settings_class = settings_model
+
+            def __call__(self, args):
+                pass
+
+        return _Command
+
+    return _make
+
+
+def test_load_settings_reads_config(tmp_path, monkeypatch, command_class):
+    class _Settings(BaseModel):
+        sources: list[str] = []
+
+    # Deriving the root settings model changes class state, restore it afterwards
+    monkeypatch.setattr(HermesCommand, "settings_class", HermesCommand.settings_class)
+    monkeypatch.setattr(
+        HermesCommand,
+        "_base_settings_class",
+        HermesCommand.__dict__.get("_base_settings_class", HermesCommand.settings_class),
+        raising=False,
+    )
+    HermesCommand.derive_settings_class({"test": _Settings})
+
+    (tmp_path / "hermes.toml").write_text('[test]\nsources = ["cff"]\n')
+    command = command_class(_Settings)(None)
+    command.load_settings(Namespace(path=tmp_path, config="hermes.toml"))
+
+    assert command.settings.sources == ["cff"]
+
+
+def test_derive_settings_class_does_not_stack(command_class):
+    class _PluginSettings(BaseModel):
+        value: int = 1
+
+    class _Settings(BaseModel):
+        pass
+
+    _Command = command_class(_Settings)
+    _Command.derive_settings_class({"plugin": _PluginSettings})
+    assert _Command.settings_class.__bases__ == (_Settings, )
+    assert _Command.settings_class().plugin.value == 1
+
+    _Command.derive_settings_class({"plugin": _PluginSettings})
+    assert _Command.settings_class.__bases__ == (_Settings, )
+
+
+def test_patch_settings_converts_values(command_class):
+    class _PluginSettings(BaseModel):
+        count: int = 1
+        name: str = "foo"
+
+    class _Settings(BaseModel):
+        plugin: _PluginSettings = _PluginSettings()
+        enabled: bool = False
+
+    command = command_class(_Settings)(None)
+    command.settings = _Settings()
+    command.patch_settings(Namespace(options=[("plugin.count", "42"), ("plugin.name", "bar"), ("enabled", "true")]))
+
+    assert command.settings.plugin.count == 42
+    assert command.settings.plugin.name == "bar"
+    assert command.settings.enabled is True
+
+
+def test_patch_settings_checks_constraints(command_class):
+    class _Settings(BaseModel):
+        workers: int = Field(4, ge=1)
+
+    command = command_class(_Settings)(None)
+    command.settings = _Settings()
+    with pytest.raises(ValidationError):
+        command.patch_settings(Namespace(options=[("workers", "0")]))
+
+    assert command.settings.workers == 4
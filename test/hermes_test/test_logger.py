@@ -0,0 +1,18 @@
+# SPDX-FileCopyrightText: 2026 German Aerospace Center (DLR)
+#
+# SPDX-License-Identifier: Apache-2.0
+
+import logging
+
+from hermes.logger import _LazyFileHandler
+
+
+def test_lazy_file_handler_creates_directory_on_first_record(tmp_path):
+    log_path = tmp_path / ".hermes" / "audit.log"
+    handler = _LazyFileHandler(log_path, delay=True)
+    assert not log_path.parent.exists()
+
+    handler.emit(logging.makeLogRecord({"msg": "test"}))
+    handler.close()
+
+    assert log_path.read_text() == "test\n"